@@ -12,6 +12,20 @@ class Settings(BaseSettings):
     postgres_db: str = "ai_journal"
     postgres_host: str = "localhost"
     postgres_port: int = 5432
+    # Optional read replica (full SQLAlchemy URL); search/chat/listing reads use
+    # it when set, everything else stays on the primary.
+    database_read_url: str = ""
+
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_pool_slow_checkout_ms: float = 250.0
+    # asyncpg's own statement cache and SQLAlchemy's prepared-statement cache.
+    # Set both to 0 when running behind pgbouncer in transaction mode.
+    db_statement_cache_size: int = 100
+    db_prepared_statement_cache_size: int = 100
 
     openai_api_key: str = ""
     openai_base_url: str = "http://localhost:1234/v1"
@@ -30,6 +44,16 @@ class Settings(BaseSettings):
             f"{self.postgres_port}/{self.postgres_db}"
         )
 
+    @property
+    def database_read_url_async(self) -> str | None:
+        url = self.database_read_url.strip()
+        if not url:
+            return None
+        for prefix in ("postgresql://", "postgres://"):
+            if url.startswith(prefix):
+                return "postgresql+asyncpg://" + url[len(prefix):]
+        return url
+
 
 @lru_cache
 def get_settings() -> Settings:
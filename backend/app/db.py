@@ -1,17 +1,114 @@
+from __future__ import annotations
+
+import time
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import structlog
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlmodel import SQLModel
 
 from app.core.config import get_settings
 
+logger = structlog.get_logger()
 settings = get_settings()
 
-engine = create_async_engine(settings.database_url_async, future=True, echo=False)
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each connection checkout takes.
+
+    Checkout time covers waiting for a free pooled connection and, when the
+    pool has to grow into its overflow, opening the new connection.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_checkout = 0.0
+        self.max_checkout = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            logger.warning(
+                "db.pool.timeout",
+                pool=self.logging_name,
+                status=self.status(),
+            )
+            raise
+        elapsed = time.perf_counter() - started
+        self.checkouts += 1
+        self.total_checkout += elapsed
+        self.max_checkout = max(self.max_checkout, elapsed)
+        if elapsed * 1000 >= settings.db_pool_slow_checkout_ms:
+            logger.warning(
+                "db.pool.slow_checkout",
+                pool=self.logging_name,
+                checkout_ms=round(elapsed * 1000, 1),
+                status=self.status(),
+            )
+        return conn
+
+    def stats(self) -> dict[str, Any]:
+        # QueuePool uses a negative max overflow (and pool_size=0) for
+        # "unbounded"; report that as no capacity rather than the sentinel.
+        unbounded = self._max_overflow < 0
+        max_overflow = None if unbounded else self._max_overflow
+        capacity = None if unbounded else self.size() + self._max_overflow
+        checked_out = self.checkedout()
+        return {
+            "size": self.size(),
+            "max_overflow": max_overflow,
+            "capacity": capacity,
+            "checked_in": self.checkedin(),
+            "checked_out": checked_out,
+            # The internal counter starts at -pool_size.
+            "overflow": max(self.overflow(), 0),
+            "saturation": round(checked_out / capacity, 3) if capacity else None,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_checkout_ms": round(self.total_checkout / self.checkouts * 1000, 3)
+            if self.checkouts
+            else 0.0,
+            "max_checkout_ms": round(self.max_checkout * 1000, 3),
+        }
+
+
+def _create_engine(url: str, name: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        future=True,
+        echo=False,
+        poolclass=TimedQueuePool,
+        pool_logging_name=name,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        },
+    )
+
+
+engine = _create_engine(settings.database_url_async, "primary")
 async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+_read_url = settings.database_read_url_async
+read_engine = _create_engine(_read_url, "replica") if _read_url else engine
+async_read_session = sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 
 async def init_db() -> None:
     import app.models  # noqa: F401
@@ -24,3 +121,16 @@ async def init_db() -> None:
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only endpoints; routed to the replica when configured."""
+    async with async_read_session() as session:
+        yield session
+
+
+def pool_stats() -> dict[str, Any]:
+    stats = {"primary": engine.sync_engine.pool.stats()}
+    if read_engine is not engine:
+        stats["replica"] = read_engine.sync_engine.pool.stats()
+    return stats
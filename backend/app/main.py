@@ -10,18 +10,21 @@ from fastapi import (
     FastAPI,
     Header,
     HTTPException,
+    Query,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
-from app.db import get_session, init_db
+from app.db import get_read_session, get_session, init_db, pool_stats
 from app.models import Event, EventCreate, EventRead, SourceType
-from app.services.content import fetch_article
+from app.services.fetch_cache import fetch_article_cached, find_processed_duplicate
 from app.services.llm import chat_completion, get_embedding
 from app.services.tasks import enqueue_event_processing
+from app.services.timeline import InvalidCursor, export_ndjson, list_timeline
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -38,6 +41,11 @@ class ChatRequest(BaseModel):
     limit: int = 5
 
 
+class TimelinePage(BaseModel):
+    items: list[EventRead]
+    next_cursor: Optional[str] = None
+
+
 def _extract_bearer(token: Optional[str]) -> Optional[str]:
     if not token:
         return None
@@ -84,41 +92,59 @@ async def health_check(session: AsyncSession = Depends(get_session)):
         raise HTTPException(status_code=500, detail="unhealthy")
 
 
+@app.get("/health/db")
+async def db_pool_health():
+    return {"pools": pool_stats()}
+
+
 @app.post("/api/ingest")
 async def ingest_event(
     event_data: EventCreate,
     session: AsyncSession = Depends(get_session),
     _: Any = Depends(verify_api_key),
 ):
+    # Re-captures of unchanged pages reuse the earlier event's LLM output.
+    previous: Optional[Event] = None
     if (
         (not event_data.content or not event_data.content.strip())
         and event_data.url_or_path
     ):
-        article = await fetch_article(event_data.url_or_path)
-        if article:
+        fetched = await fetch_article_cached(session, event_data.url_or_path)
+        if fetched:
+            article = fetched.article
             event_data.content = article.content
             if not event_data.title and article.title:
                 event_data.title = article.title
+            if fetched.unchanged:
+                previous = await find_processed_duplicate(
+                    session, event_data.url_or_path, article.content
+                )
 
     metadata_values = event_data.metadata_ or {}
     if metadata_values is None:
         metadata_values = {}
     metadata_values = dict(metadata_values)
     metadata_values.setdefault("captured_at", datetime.utcnow().isoformat())
+    if previous:
+        metadata_values["reused_from"] = str(previous.id)
     event_data.metadata_ = metadata_values
 
     event = Event(**event_data.dict(by_alias=True))
+    if previous:
+        event.embedding = previous.embedding
+        event.summary = previous.summary
     session.add(event)
     await session.commit()
     await session.refresh(event)
-    enqueue_event_processing(str(event.id))
+    if event.embedding is None or not event.summary:
+        enqueue_event_processing(str(event.id))
     return {"status": "received", "id": str(event.id)}
 
 
 @app.post("/api/search", response_model=list[EventRead])
 async def search_events(
     request: SearchRequest,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: Any = Depends(verify_api_key),
 ):
     query_vector = await get_embedding(request.query)
@@ -136,7 +162,7 @@ async def search_events(
 @app.post("/api/chat")
 async def chat_with_memory(
     request: ChatRequest,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: Any = Depends(verify_api_key),
 ):
     query_vector = await get_embedding(request.query)
@@ -188,6 +214,49 @@ async def chat_with_memory(
     return {"answer": answer, "sources": sources}
 
 
+@app.get("/api/events", response_model=TimelinePage)
+async def list_events(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    source_type: Optional[SourceType] = None,
+    source_app: Optional[str] = None,
+    session: AsyncSession = Depends(get_read_session),
+    _: Any = Depends(verify_api_key),
+):
+    try:
+        rows, next_cursor = await list_timeline(
+            session,
+            limit,
+            cursor=cursor,
+            source_type=source_type,
+            source_app=source_app,
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+    return TimelinePage(
+        items=[EventRead.model_validate(row) for row in rows],
+        next_cursor=next_cursor,
+    )
+
+
+@app.get("/api/events/export")
+async def export_events(
+    include_embeddings: bool = False,
+    source_type: Optional[SourceType] = None,
+    source_app: Optional[str] = None,
+    _: Any = Depends(verify_api_key),
+):
+    return StreamingResponse(
+        export_ndjson(
+            include_embeddings=include_embeddings,
+            source_type=source_type,
+            source_app=source_app,
+        ),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="events.ndjson"'},
+    )
+
+
 @app.delete("/api/events/{event_id}")
 async def delete_event(
     event_id: str,
@@ -46,6 +46,19 @@ class Event(EventBase, table=True):
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
 
 
+class UrlFetchCache(SQLModel, table=True):
+    __tablename__ = "url_fetch_cache"
+
+    url: str = Field(primary_key=True)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: str
+    title: Optional[str] = None
+    content: str
+    fetched_at: datetime = Field(default_factory=datetime.utcnow)
+    checked_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class EventCreate(EventBase):
     pass
 
@@ -54,7 +67,7 @@ class EventRead(EventBase):
     id: UUID
 
 
-# Indexes for vector search and metadata queries
+# Indexes for vector search, timeline keyset pagination and metadata queries
 Index(
     "ix_events_embedding_hnsw",
     Event.__table__.c.embedding,
@@ -62,6 +75,23 @@ Index(
     postgresql_with={"m": 16, "ef_construction": 64},
     postgresql_ops={"embedding": "vector_cosine_ops"},
 )
+Index(
+    "ix_events_created_at_id",
+    Event.__table__.c.created_at,
+    Event.__table__.c.id,
+)
+Index(
+    "ix_events_source_type_created_at_id",
+    Event.__table__.c.source_type,
+    Event.__table__.c.created_at,
+    Event.__table__.c.id,
+)
+Index(
+    "ix_events_source_app_created_at_id",
+    Event.__table__.c.source_app,
+    Event.__table__.c.created_at,
+    Event.__table__.c.id,
+)
 Index(
     "ix_events_metadata_gin",
     Event.__table__.c.metadata,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
 
 import httpx
@@ -14,22 +15,49 @@ USER_AGENT = (
     "(KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36"
 )
 MAX_CHARS = 20000
+MAX_TITLE_CHARS = 512
 
 
 @dataclass
 class Article:
     title: str | None
     content: str
+    etag: str | None = None
+    last_modified: str | None = None
 
 
-async def fetch_article(url: str) -> Article | None:
+@dataclass
+class NotModified:
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+async def fetch_article(
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> Article | NotModified | None:
+    headers = {"User-Agent": USER_AGENT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
     try:
         async with httpx.AsyncClient(
             timeout=15.0,
             follow_redirects=True,
-            headers={"User-Agent": USER_AGENT},
+            headers=headers,
         ) as client:
             resp = await client.get(url)
+        if resp.status_code == 304:
+            return NotModified(
+                etag=resp.headers.get("etag"),
+                last_modified=resp.headers.get("last-modified"),
+            )
         resp.raise_for_status()
     except httpx.HTTPError as exc:
         logger.warning("fetch_article.http_error", url=url, error=str(exc))
@@ -41,7 +69,8 @@ async def fetch_article(url: str) -> Article | None:
         return None
 
     doc = Document(resp.text)
-    article_title = (doc.short_title() or doc.title() or "").strip() or None
+    raw_title = (doc.short_title() or doc.title() or "").strip()
+    article_title = raw_title[:MAX_TITLE_CHARS] or None
     summary_html = doc.summary()
     soup = BeautifulSoup(summary_html, "html.parser")
     text = soup.get_text(separator="\n")
@@ -52,4 +81,9 @@ async def fetch_article(url: str) -> Article | None:
         return None
 
     truncated = cleaned[:MAX_CHARS]
-    return Article(title=article_title, content=truncated)
+    return Article(
+        title=article_title,
+        content=truncated,
+        etag=resp.headers.get("etag"),
+        last_modified=resp.headers.get("last-modified"),
+    )
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Event, UrlFetchCache
+from app.services.content import Article, NotModified, content_hash, fetch_article
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class CachedFetch:
+    article: Article
+    # True when the extracted text matches the cached extraction (304 or
+    # same content hash), i.e. an earlier capture already holds this text.
+    unchanged: bool
+
+
+async def fetch_article_cached(session: AsyncSession, url: str) -> CachedFetch | None:
+    """Fetch ``url`` with a conditional GET against the per-URL cache.
+
+    On 304 the cached extraction is returned without re-parsing the page.
+    The cache row is written on ``session`` but not committed.
+    """
+    entry = await session.get(UrlFetchCache, url)
+    # Release the connection before the (slow) outbound fetch; the cache
+    # write happens afterwards in the caller's event transaction.
+    await session.commit()
+    result = await fetch_article(
+        url,
+        etag=entry.etag if entry else None,
+        last_modified=entry.last_modified if entry else None,
+    )
+    now = datetime.utcnow()
+
+    if isinstance(result, NotModified):
+        if entry is None:
+            return None
+        logger.info("fetch_article.not_modified", url=url)
+        entry.etag = result.etag or entry.etag
+        entry.last_modified = result.last_modified or entry.last_modified
+        entry.checked_at = now
+        session.add(entry)
+        article = Article(
+            title=entry.title,
+            content=entry.content,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+        )
+        return CachedFetch(article=article, unchanged=True)
+    if result is None:
+        return None
+
+    digest = content_hash(result.content)
+    unchanged = entry is not None and entry.content_hash == digest
+    values = {
+        "etag": result.etag,
+        "last_modified": result.last_modified,
+        "content_hash": digest,
+        "title": result.title,
+        "content": result.content,
+        "fetched_at": now,
+        "checked_at": now,
+    }
+    stmt = insert(UrlFetchCache).values(url=url, **values)
+    stmt = stmt.on_conflict_do_update(index_elements=["url"], set_=values)
+    await session.execute(stmt)
+    return CachedFetch(article=result, unchanged=unchanged)
+
+
+async def find_processed_duplicate(
+    session: AsyncSession, url_or_path: str, content: str
+) -> Event | None:
+    """Latest fully processed event for the same location and content."""
+    stmt = (
+        select(Event)
+        .where(Event.url_or_path == url_or_path)
+        .where(Event.content == content)
+        .where(Event.embedding.isnot(None))
+        .where(Event.summary.isnot(None))
+        .where(Event.summary != "")
+        .order_by(Event.created_at.desc())
+        .limit(1)
+    )
+    result = await session.execute(stmt)
+    return result.scalars().first()
@@ -18,7 +18,7 @@ async def process_event(event_id: str) -> None:
 
         text = event.content or ""
 
-        if not event.embedding:
+        if event.embedding is None:
             event.embedding = await get_embedding(text)
         if not event.summary:
             event.summary = await generate_summary(text)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import base64
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+import orjson
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import async_read_session
+from app.models import Event, SourceType
+
+EXPORT_BATCH_SIZE = 500
+
+# Timeline/export rows skip the 1536-dim embedding unless asked for.
+_BASE_COLUMNS = [c for c in Event.__table__.c if c.name != "embedding"]
+# EventRead validates by field name, so the JSONB column is keyed metadata_.
+_TIMELINE_COLUMNS = [
+    c.label("metadata_") if c.name == "metadata" else c for c in _BASE_COLUMNS
+]
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at: datetime, event_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{event_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded).decode()
+        created_at, _, event_id = raw.partition("|")
+        parsed = datetime.fromisoformat(created_at), UUID(event_id)
+    except ValueError as exc:
+        raise InvalidCursor(cursor) from exc
+    # events.created_at is timestamp without time zone.
+    if parsed[0].tzinfo is not None:
+        raise InvalidCursor(cursor)
+    return parsed
+
+
+def _filtered(
+    stmt: Select,
+    source_type: Optional[SourceType],
+    source_app: Optional[str],
+) -> Select:
+    if source_type is not None:
+        stmt = stmt.where(Event.source_type == source_type)
+    if source_app:
+        stmt = stmt.where(Event.source_app == source_app)
+    return stmt
+
+
+async def list_timeline(
+    session: AsyncSession,
+    limit: int,
+    cursor: Optional[str] = None,
+    source_type: Optional[SourceType] = None,
+    source_app: Optional[str] = None,
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """Newest-first page of events keyed on ``(created_at, id)``.
+
+    The row comparison against the cursor walks ``ix_events_created_at_id``
+    (or the ``source_type``/``source_app``-prefixed variant when filtering)
+    backwards, so every page costs the same regardless of depth. Combining
+    both filters uses one of those indexes and rechecks the other column.
+    """
+    stmt = _filtered(select(*_TIMELINE_COLUMNS), source_type, source_app)
+    if cursor:
+        created_at, event_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Event.created_at, Event.id) < tuple_(created_at, event_id)
+        )
+    stmt = stmt.order_by(Event.created_at.desc(), Event.id.desc()).limit(limit + 1)
+
+    result = await session.execute(stmt)
+    rows = [dict(row) for row in result.mappings()]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    return rows, next_cursor
+
+
+async def export_ndjson(
+    include_embeddings: bool = False,
+    source_type: Optional[SourceType] = None,
+    source_app: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """Stream events oldest-first as NDJSON through a server-side cursor.
+
+    Opens its own session because it outlives the request dependencies.
+    """
+    columns = list(_BASE_COLUMNS)
+    if include_embeddings:
+        columns.append(Event.__table__.c.embedding)
+    stmt = (
+        _filtered(select(*columns), source_type, source_app)
+        .order_by(Event.created_at, Event.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+    async with async_read_session() as session:
+        result = await session.stream(stmt)
+        async for row in result.mappings():
+            yield orjson.dumps(
+                dict(row),
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE,
+            )
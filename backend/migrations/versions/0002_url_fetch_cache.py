@@ -0,0 +1,33 @@
+"""create url fetch cache table
+
+Revision ID: 0002_url_fetch_cache
+Revises: 0001_create_events
+Create Date: 2026-10-19 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0002_url_fetch_cache"
+down_revision = "0001_create_events"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "url_fetch_cache",
+        sa.Column("url", sa.String(length=1024), primary_key=True),
+        sa.Column("etag", sa.String(length=512), nullable=True),
+        sa.Column("last_modified", sa.String(length=64), nullable=True),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("title", sa.String(length=512), nullable=True),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=False), nullable=False),
+        sa.Column("checked_at", sa.DateTime(timezone=False), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("url_fetch_cache")
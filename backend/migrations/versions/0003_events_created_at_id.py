@@ -0,0 +1,41 @@
+"""add events (created_at, id) indexes for timeline pagination
+
+Revision ID: 0003_events_created_at_id
+Revises: 0002_url_fetch_cache
+Create Date: 2026-10-19 00:00:00
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_events_created_at_id"
+down_revision = "0002_url_fetch_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_events_created_at_id",
+        "events",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_events_source_type_created_at_id",
+        "events",
+        ["source_type", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_events_source_app_created_at_id",
+        "events",
+        ["source_app", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_source_app_created_at_id", table_name="events")
+    op.drop_index("ix_events_source_type_created_at_id", table_name="events")
+    op.drop_index("ix_events_created_at_id", table_name="events")